@@ -25,28 +25,31 @@ I_UNIT = 1j  # Imaginary unit
 class QuantumSimulator:
     """Core quantum state simulator"""
     
-    def __init__(self, num_qubits: int, backend: str = "numpy"):
+    def __init__(self, num_qubits: int, backend: str = "numpy", dtype=np.complex128):
         """Initialize the quantum simulator
-        
+
         Args:
             num_qubits: Number of qubits to simulate
             backend: Simulation backend to use
+            dtype: Complex dtype of the state vector (complex64 halves
+                memory bandwidth at the cost of FP32 precision)
         """
         self.num_qubits = num_qubits
         self.backend = backend
-        
+        self.dtype = dtype
+
         # Initialize state vector to |0...0⟩
         self.dim = 2 ** num_qubits
-        self.state_vector = np.zeros(self.dim, dtype=complex)
+        self.state_vector = np.zeros(self.dim, dtype=dtype)
         self.state_vector[0] = 1.0
-        
+
         # For tracking measurements
         self.measured_qubits = set()
         self.measurement_results = {}
-    
+
     def reset(self):
         """Reset the quantum state to |0...0⟩"""
-        self.state_vector = np.zeros(self.dim, dtype=complex)
+        self.state_vector = np.zeros(self.dim, dtype=self.dtype)
         self.state_vector[0] = 1.0
         self.measured_qubits = set()
         self.measurement_results = {}
@@ -18,7 +18,7 @@ import numpy as np
 import matplotlib.pyplot as plt
 import tensorflow as tf
 from tensorflow.keras import models, layers, applications
-from sklearn.cluster import KMeans
+from sklearn.cluster import KMeans, MiniBatchKMeans
 from sklearn.metrics import accuracy_score
 import mediapipe as mp
 import pytesseract
@@ -34,11 +34,64 @@ from enum import Enum, auto
 import logging
 from pathlib import Path
 import pickle
+import threading
+import queue
+from concurrent.futures import ThreadPoolExecutor
 
 # Configure logging
 logging.basicConfig(level=logging.INFO)
 logger = logging.getLogger(__name__)
 
+# Optional TensorRT runtime for GPU inference; falls back to cv2.dnn if absent
+try:
+    import tensorrt as trt
+    import pycuda.driver as cuda
+    import pycuda.autoinit  # noqa: F401 - initializes the CUDA context
+    TENSORRT_AVAILABLE = True
+except ImportError:
+    TENSORRT_AVAILABLE = False
+
+# Optional ONNX Runtime for quantized CPU inference
+try:
+    import onnxruntime
+    ONNXRUNTIME_AVAILABLE = True
+except ImportError:
+    ONNXRUNTIME_AVAILABLE = False
+
+# Optional Numba JIT for tight numeric loops
+try:
+    from numba import njit
+    NUMBA_AVAILABLE = True
+except ImportError:
+    NUMBA_AVAILABLE = False
+
+def _landmark_bbox(buf: np.ndarray) -> Tuple[float, float, float, float]:
+    """Single-pass min/max reduction over an (N, 2) landmark buffer
+
+    Args:
+        buf: Normalized landmark coordinates, one (x, y) row per landmark
+
+    Returns:
+        Tuple of (x_min, y_min, x_max, y_max)
+    """
+    x_min = x_max = buf[0, 0]
+    y_min = y_max = buf[0, 1]
+    for i in range(1, buf.shape[0]):
+        x = buf[i, 0]
+        y = buf[i, 1]
+        if x < x_min:
+            x_min = x
+        elif x > x_max:
+            x_max = x
+        if y < y_min:
+            y_min = y
+        elif y > y_max:
+            y_max = y
+    return x_min, y_min, x_max, y_max
+
+if NUMBA_AVAILABLE:
+    _landmark_bbox = njit(cache=True)(_landmark_bbox)
+
 class DetectionMode(Enum):
     """Detection modes for the vision system"""
     OBJECT_DETECTION = auto()
@@ -49,6 +102,41 @@ class DetectionMode(Enum):
     POSE_ESTIMATION = auto()
     HAND_TRACKING = auto()
 
+class FrameViews:
+    """Per-frame color-space views shared between detectors
+
+    Each detector used to run its own cvtColor over the full frame, which
+    re-reads megabytes per frame in multi-mode pipelines. The RGB and
+    grayscale views are computed lazily here, once, and passed down.
+    """
+
+    def __init__(self, bgr: np.ndarray):
+        """Wrap a BGR frame
+
+        Args:
+            bgr: Frame as loaded by OpenCV
+        """
+        self.bgr = bgr
+        self._rgb = None
+        self._gray = None
+
+    @property
+    def rgb(self) -> np.ndarray:
+        """RGB view, converted on first access"""
+        if self._rgb is None:
+            if len(self.bgr.shape) == 3 and self.bgr.shape[2] == 3:
+                self._rgb = cv2.cvtColor(self.bgr, cv2.COLOR_BGR2RGB)
+            else:
+                self._rgb = self.bgr
+        return self._rgb
+
+    @property
+    def gray(self) -> np.ndarray:
+        """Grayscale view, converted on first access"""
+        if self._gray is None:
+            self._gray = cv2.cvtColor(self.bgr, cv2.COLOR_BGR2GRAY)
+        return self._gray
+
 @dataclass
 class DetectionResult:
     """Result of a detection operation"""
@@ -58,6 +146,102 @@ class DetectionResult:
     label: str
     metadata: Dict[str, Any]
 
+class TRTYoloBackend:
+    """YOLO inference through a prebuilt TensorRT engine
+
+    TensorRT fuses conv+bn+activation and schedules FP16 tensor cores,
+    which roughly doubles FPS over cv2.dnn inference on the same GPU.
+    Build the engine offline with:
+        trtexec --onnx=yolov4.onnx --fp16 --saveEngine=yolov4.engine
+    """
+
+    def __init__(self, engine_path: str):
+        """Load the engine and allocate reusable device buffers
+
+        Args:
+            engine_path: Path to the serialized .engine file
+        """
+        self.trt_logger = trt.Logger(trt.Logger.WARNING)
+        with open(engine_path, 'rb') as f, trt.Runtime(self.trt_logger) as runtime:
+            self.engine = runtime.deserialize_cuda_engine(f.read())
+        self.context = self.engine.create_execution_context()
+
+        # One persistent stream so H2D/D2H copies overlap the next frame's
+        # preprocessing; buffers are allocated once and reused per frame
+        self.stream = cuda.Stream()
+        self.bindings = []
+        self.host_inputs, self.device_inputs = [], []
+        self.host_outputs, self.device_outputs = [], []
+
+        for binding in self.engine:
+            size = trt.volume(self.engine.get_binding_shape(binding))
+            dtype = trt.nptype(self.engine.get_binding_dtype(binding))
+            host_mem = cuda.pagelocked_empty(size, dtype)
+            device_mem = cuda.mem_alloc(host_mem.nbytes)
+            self.bindings.append(int(device_mem))
+
+            if self.engine.binding_is_input(binding):
+                self.host_inputs.append(host_mem)
+                self.device_inputs.append(device_mem)
+            else:
+                self.host_outputs.append(host_mem)
+                self.device_outputs.append(device_mem)
+
+    def infer(self, blob: np.ndarray) -> List[np.ndarray]:
+        """Run one inference pass
+
+        Args:
+            blob: Preprocessed input blob (NCHW float32)
+
+        Returns:
+            List of flat output arrays, one per engine output binding
+        """
+        np.copyto(self.host_inputs[0], blob.ravel())
+        cuda.memcpy_htod_async(self.device_inputs[0], self.host_inputs[0], self.stream)
+        self.context.execute_async_v2(self.bindings, self.stream.handle)
+        for host_mem, device_mem in zip(self.host_outputs, self.device_outputs):
+            cuda.memcpy_dtoh_async(host_mem, device_mem, self.stream)
+        self.stream.synchronize()
+
+        return [out.copy() for out in self.host_outputs]
+
+class ONNXRuntimeBackend:
+    """Quantized YOLO inference through ONNX Runtime on CPU
+
+    An INT8-quantized model (see quantize_yolo_int8.py) uses a quarter of
+    the bandwidth of FP32 and maps onto VNNI instructions on modern x86,
+    roughly doubling CPU throughput with minimal accuracy loss. OpenVINO
+    is preferred as execution provider when installed.
+    """
+
+    def __init__(self, model_path: str):
+        """Create the inference session
+
+        Args:
+            model_path: Path to the (quantized) ONNX model
+        """
+        sess_options = onnxruntime.SessionOptions()
+        # Leave half the cores for the video reader/writer threads
+        sess_options.intra_op_num_threads = max(1, (os.cpu_count() or 2) // 2)
+
+        self.session = onnxruntime.InferenceSession(
+            model_path, sess_options,
+            providers=['OpenVINOExecutionProvider', 'CPUExecutionProvider'])
+        self.input_name = self.session.get_inputs()[0].name
+        self.output_names = [output.name for output in self.session.get_outputs()]
+
+    def infer(self, blob: np.ndarray) -> List[np.ndarray]:
+        """Run one inference pass
+
+        Args:
+            blob: Preprocessed input blob (NCHW float32)
+
+        Returns:
+            List of output arrays
+        """
+        return self.session.run(self.output_names,
+                                {self.input_name: blob.astype(np.float32, copy=False)})
+
 class ObjectDetector:
     """Advanced object detection using YOLO and other models"""
     
@@ -69,12 +253,42 @@ class ObjectDetector:
         """
         self.model_path = model_path
         self.net = None
+        self.trt_backend = None
+        self.ort_backend = None
         self.output_layers = None
         self.classes = []
         self.colors = np.random.uniform(0, 255, size=(100, 3))
-        
+
+        # Persistent preprocessing buffers: the (1,3,416,416) blob is ~2 MB
+        # and was reallocated by blobFromImage on every frame
+        self._blob = np.empty((1, 3, 416, 416), np.float32)
+        self._resize_buf = np.empty((416, 416, 3), np.uint8)
+
         # Load YOLO model
         self.load_yolo_model()
+
+    def _fill_blob(self, image: np.ndarray) -> np.ndarray:
+        """Fill the persistent preprocessing blob in place
+
+        Equivalent to blobFromImage(image, 0.00392, (416,416), swapRB=True)
+        but the resize lands in a reusable buffer and the scale/swap/
+        transpose steps write straight into the cached blob, avoiding a
+        fresh allocation per frame.
+
+        Args:
+            image: Input BGR image
+
+        Returns:
+            The shared NCHW float32 blob
+        """
+        cv2.resize(image, (416, 416), dst=self._resize_buf, interpolation=cv2.INTER_LINEAR)
+
+        # BGR->RGB swap and HWC->CHW transpose, scaled to [0, 1]
+        np.multiply(self._resize_buf[:, :, 2], 0.00392, out=self._blob[0, 0])
+        np.multiply(self._resize_buf[:, :, 1], 0.00392, out=self._blob[0, 1])
+        np.multiply(self._resize_buf[:, :, 0], 0.00392, out=self._blob[0, 2])
+
+        return self._blob
     
     def load_yolo_model(self):
         """Load YOLO model for object detection"""
@@ -83,7 +297,40 @@ class ObjectDetector:
             weights_path = "yolo/yolov4.weights"
             config_path = "yolo/yolov4.cfg"
             classes_path = "yolo/coco.names"
-            
+            engine_path = "yolo/yolov4.engine"
+
+            # Prefer a prebuilt TensorRT engine when the runtime is available
+            if TENSORRT_AVAILABLE and os.path.exists(engine_path):
+                try:
+                    self.trt_backend = TRTYoloBackend(engine_path)
+                    with open(classes_path, 'r') as f:
+                        self.classes = [line.strip() for line in f.readlines()]
+
+                    # Pin the blob so async H2D copies can DMA directly from it
+                    try:
+                        self._blob = cuda.register_host_memory(self._blob)
+                    except cuda.Error:
+                        pass
+
+                    logger.info("TensorRT YOLO engine loaded")
+                    return
+                except Exception as e:
+                    logger.error(f"Error loading TensorRT engine: {e}")
+                    self.trt_backend = None
+
+            # On CPU-only machines, prefer an INT8 ONNX model over FP32 cv2.dnn
+            int8_model_path = "yolo/yolov4_int8.onnx"
+            if ONNXRUNTIME_AVAILABLE and os.path.exists(int8_model_path):
+                try:
+                    self.ort_backend = ONNXRuntimeBackend(int8_model_path)
+                    with open(classes_path, 'r') as f:
+                        self.classes = [line.strip() for line in f.readlines()]
+                    logger.info("INT8 ONNX Runtime model loaded")
+                    return
+                except Exception as e:
+                    logger.error(f"Error loading INT8 ONNX model: {e}")
+                    self.ort_backend = None
+
             if os.path.exists(weights_path) and os.path.exists(config_path):
                 self.net = cv2.dnn.readNet(weights_path, config_path)
                 layer_names = self.net.getLayerNames()
@@ -94,6 +341,10 @@ class ObjectDetector:
                     self.classes = [line.strip() for line in f.readlines()]
                 
                 logger.info("YOLO model loaded successfully")
+
+                # Run convolutions on the GPU when one is available
+                if self._enable_cuda_backend():
+                    self._warmup_net()
             else:
                 logger.warning("YOLO model files not found, using fallback detection")
                 self.load_fallback_model()
@@ -110,31 +361,81 @@ class ObjectDetector:
                 'models/frozen_inference_graph.pb',
                 'models/ssd_mobilenet_v2_coco.pbtxt'
             )
-            self.classes = ['background', 'person', 'bicycle', 'car', 'motorcycle', 
+            self.classes = ['background', 'person', 'bicycle', 'car', 'motorcycle',
                           'airplane', 'bus', 'train', 'truck', 'boat']
             logger.info("Fallback model loaded")
+
+            if self._enable_cuda_backend():
+                self._warmup_net()
         except:
             logger.warning("No pre-trained models available, using basic detection")
+
+    def _enable_cuda_backend(self) -> bool:
+        """Route DNN inference through CUDA if a GPU is available
+
+        Returns:
+            True if the CUDA backend was enabled
+        """
+        try:
+            if cv2.cuda.getCudaEnabledDeviceCount() > 0:
+                self.net.setPreferableBackend(cv2.dnn.DNN_BACKEND_CUDA)
+                self.net.setPreferableTarget(cv2.dnn.DNN_TARGET_CUDA_FP16)
+                logger.info("DNN inference running on CUDA (FP16)")
+                return True
+        except (cv2.error, AttributeError):
+            pass
+        return False
+
+    def _warmup_net(self):
+        """Run one forward pass on a zero blob
+
+        This lets the cuDNN autotuner pick kernels before the first real
+        frame, and drops from FP16 to FP32 CUDA if the half-precision
+        path produces NaNs on this hardware.
+        """
+        try:
+            blob = np.zeros((1, 3, 416, 416), dtype=np.float32)
+            self.net.setInput(blob)
+            outputs = self.net.forward(self.output_layers) if self.output_layers else self.net.forward()
+            outs = outputs if isinstance(outputs, (list, tuple)) else [outputs]
+
+            if any(np.isnan(out).any() for out in outs):
+                logger.warning("FP16 inference produced NaNs, falling back to FP32 CUDA")
+                self.net.setPreferableTarget(cv2.dnn.DNN_TARGET_CUDA)
+        except cv2.error as e:
+            logger.warning(f"DNN warmup failed: {e}")
     
-    def detect_objects(self, image: np.ndarray, confidence_threshold: float = 0.5) -> List[DetectionResult]:
+    def detect_objects(self, image: np.ndarray, confidence_threshold: float = 0.5,
+                       views: FrameViews = None) -> List[DetectionResult]:
         """Detect objects in an image
-        
+
         Args:
             image: Input image
             confidence_threshold: Minimum confidence for detection
-            
+            views: Precomputed color-space views of the image (optional)
+
         Returns:
             List of detection results
         """
-        if self.net is None:
-            return self.detect_objects_basic(image)
-        
+        if self.net is None and self.trt_backend is None and self.ort_backend is None:
+            return self.detect_objects_basic(image, views=views)
+
         height, width = image.shape[:2]
-        
-        # Prepare image for detection
-        blob = cv2.dnn.blobFromImage(image, 0.00392, (416, 416), (0, 0, 0), True, crop=False)
-        self.net.setInput(blob)
-        outputs = self.net.forward(self.output_layers)
+
+        # Prepare image for detection (reuses the persistent blob buffer)
+        blob = self._fill_blob(image)
+
+        if self.trt_backend is not None:
+            # TensorRT returns flat buffers; restore the (boxes, 5+classes)
+            # row layout so the NMS post-processing below is unchanged
+            row_len = 5 + len(self.classes)
+            outputs = [out.reshape(-1, row_len) for out in self.trt_backend.infer(blob)]
+        elif self.ort_backend is not None:
+            row_len = 5 + len(self.classes)
+            outputs = [np.asarray(out).reshape(-1, row_len) for out in self.ort_backend.infer(blob)]
+        else:
+            self.net.setInput(blob)
+            outputs = self.net.forward(self.output_layers)
         
         # Process detections
         boxes = []
@@ -179,30 +480,40 @@ class ObjectDetector:
         
         return results
     
-    def detect_objects_basic(self, image: np.ndarray) -> List[DetectionResult]:
+    def detect_objects_basic(self, image: np.ndarray, views: FrameViews = None) -> List[DetectionResult]:
         """Basic object detection using traditional computer vision"""
-        # Convert to grayscale
-        gray = cv2.cvtColor(image, cv2.COLOR_BGR2GRAY)
-        
-        # Apply edge detection
-        edges = cv2.Canny(gray, 50, 150)
-        
+        # Convert to grayscale (reuses the shared view when provided)
+        gray = (views or FrameViews(image)).gray
+
+        # Edge detection on a half-scale image: 4x fewer pixels for the
+        # memory-bound Canny kernel; boxes are scaled back up afterwards
+        small = cv2.resize(gray, (0, 0), fx=0.5, fy=0.5)
+        edges = cv2.Canny(small, 50, 150)
+
         # Find contours
         contours, _ = cv2.findContours(edges, cv2.RETR_EXTERNAL, cv2.CHAIN_APPROX_SIMPLE)
-        
+
+        if not contours:
+            return []
+
+        # Compute all areas up front and mask once, so boundingRect and
+        # DetectionResult construction only run for the surviving contours.
+        # The 1000 px threshold shrinks 4x at half scale.
+        areas = np.fromiter((cv2.contourArea(c) for c in contours),
+                            dtype=np.float32, count=len(contours))
+        keep = np.where(areas > 1000 / 4)[0]
+
         results = []
-        for contour in contours:
-            area = cv2.contourArea(contour)
-            if area > 1000:  # Filter small objects
-                x, y, w, h = cv2.boundingRect(contour)
-                results.append(DetectionResult(
-                    mode=DetectionMode.OBJECT_DETECTION,
-                    confidence=0.7,
-                    bbox=(x, y, w, h),
-                    label="Object",
-                    metadata={"area": area}
-                ))
-        
+        for i in keep:
+            x, y, w, h = cv2.boundingRect(contours[i])
+            results.append(DetectionResult(
+                mode=DetectionMode.OBJECT_DETECTION,
+                confidence=0.7,
+                bbox=(x * 2, y * 2, w * 2, h * 2),
+                label="Object",
+                metadata={"area": float(areas[i] * 4)}
+            ))
+
         return results
 
 class FaceRecognitionSystem:
@@ -213,7 +524,84 @@ class FaceRecognitionSystem:
         self.known_face_encodings = []
         self.known_face_names = []
         self.face_cascade = cv2.CascadeClassifier(cv2.data.haarcascades + 'haarcascade_frontalface_default.xml')
-        
+
+        # Contiguous (N, 128) copy of the known encodings so recognition can
+        # compute all distances in one vectorized pass instead of per-face
+        # dlib calls over a Python list
+        self._known_matrix = np.empty((0, 128), dtype=np.float32)
+
+        # Pick the face-location model once: the CNN detector is far more
+        # accurate and fast when dlib was compiled with CUDA, but would be
+        # seconds per frame on CPU, where HOG stays the right choice
+        try:
+            import dlib
+            self.face_location_model = 'cnn' if dlib.DLIB_USE_CUDA else 'hog'
+        except ImportError:
+            self.face_location_model = 'hog'
+        logger.info(f"Face detection using {self.face_location_model} model")
+
+        # Detect on a quarter-scale frame: 16x fewer pixels for the detector
+        self.detection_scale = 0.25
+
+        # Optional GPU LBP cascade for the pure-detection path; far lower
+        # latency than the dlib detectors when a CUDA device is present
+        self._gpu_cascade = None
+        try:
+            if cv2.cuda.getCudaEnabledDeviceCount() > 0 and os.path.exists('lbpcascade_frontalface.xml'):
+                self._gpu_cascade = cv2.cuda.CascadeClassifier_create('lbpcascade_frontalface.xml')
+                self._gpu_cascade.setMinNeighbors(4)
+                self._gpu_cascade.setScaleFactor(1.1)
+        except (cv2.error, AttributeError):
+            self._gpu_cascade = None
+
+    def detect_faces_fast(self, image: np.ndarray, views: FrameViews = None) -> List[DetectionResult]:
+        """Detect faces with the GPU LBP cascade
+
+        Args:
+            image: Input image
+            views: Precomputed color-space views of the image (optional)
+
+        Returns:
+            List of face detection results
+        """
+        gray = (views or FrameViews(image)).gray
+
+        gpu = cv2.cuda_GpuMat()
+        gpu.upload(gray)
+        found = self._gpu_cascade.detectMultiScale(gpu)
+        rects = found.download()
+
+        results = []
+        if rects is not None:
+            for (x, y, w, h) in np.asarray(rects).reshape(-1, 4):
+                results.append(DetectionResult(
+                    mode=DetectionMode.FACE_DETECTION,
+                    confidence=0.8,
+                    bbox=(int(x), int(y), int(w), int(h)),
+                    label="Face",
+                    metadata={"detector": "lbp_cuda"}
+                ))
+
+        return results
+
+    def _locate_faces(self, rgb_image: np.ndarray) -> List[Tuple[int, int, int, int]]:
+        """Find face locations on a downscaled copy of the frame
+
+        Args:
+            rgb_image: Input image in RGB order
+
+        Returns:
+            Face locations as (top, right, bottom, left) in full-frame coordinates
+        """
+        small = cv2.resize(rgb_image, (0, 0), fx=self.detection_scale, fy=self.detection_scale)
+        locations = face_recognition.face_locations(
+            small, number_of_times_to_upsample=0, model=self.face_location_model)
+
+        # Scale the boxes back up to the original frame
+        inv = 1.0 / self.detection_scale
+        return [(int(top * inv), int(right * inv), int(bottom * inv), int(left * inv))
+                for (top, right, bottom, left) in locations]
+
     def add_known_face(self, image_path: str, name: str):
         """Add a known face to the recognition database
         
@@ -227,29 +615,36 @@ class FaceRecognitionSystem:
             
             self.known_face_encodings.append(encoding)
             self.known_face_names.append(name)
-            
+            self._known_matrix = np.vstack([self._known_matrix, encoding.astype(np.float32)])
+
             logger.info(f"Added face for {name}")
         except Exception as e:
             logger.error(f"Error adding face for {name}: {e}")
     
-    def detect_faces(self, image: np.ndarray) -> List[DetectionResult]:
+    def detect_faces(self, image: np.ndarray, views: FrameViews = None) -> List[DetectionResult]:
         """Detect faces in an image
-        
+
         Args:
             image: Input image
-            
+            views: Precomputed color-space views of the image (optional)
+
         Returns:
             List of face detection results
         """
-        # Convert to RGB if needed
-        if len(image.shape) == 3 and image.shape[2] == 3:
-            rgb_image = cv2.cvtColor(image, cv2.COLOR_BGR2RGB)
-        else:
-            rgb_image = image
-        
+        # Pure detection (no recognition) can use the GPU cascade
+        if self._gpu_cascade is not None:
+            try:
+                return self.detect_faces_fast(image, views=views)
+            except cv2.error as e:
+                logger.warning(f"GPU cascade detection failed, using dlib: {e}")
+                self._gpu_cascade = None
+
+        # Convert to RGB (reuses the shared view when provided)
+        rgb_image = (views or FrameViews(image)).rgb
+
         # Find face locations
-        face_locations = face_recognition.face_locations(rgb_image)
-        
+        face_locations = self._locate_faces(rgb_image)
+
         results = []
         for (top, right, bottom, left) in face_locations:
             results.append(DetectionResult(
@@ -262,43 +657,45 @@ class FaceRecognitionSystem:
         
         return results
     
-    def recognize_faces(self, image: np.ndarray) -> List[DetectionResult]:
+    def recognize_faces(self, image: np.ndarray, views: FrameViews = None) -> List[DetectionResult]:
         """Recognize faces in an image
-        
+
         Args:
             image: Input image
-            
+            views: Precomputed color-space views of the image (optional)
+
         Returns:
             List of face recognition results
         """
         if not self.known_face_encodings:
-            return self.detect_faces(image)
-        
-        # Convert to RGB if needed
-        if len(image.shape) == 3 and image.shape[2] == 3:
-            rgb_image = cv2.cvtColor(image, cv2.COLOR_BGR2RGB)
-        else:
-            rgb_image = image
-        
+            return self.detect_faces(image, views=views)
+
+        # Convert to RGB (reuses the shared view when provided)
+        rgb_image = (views or FrameViews(image)).rgb
+
         # Find face locations and encodings
-        face_locations = face_recognition.face_locations(rgb_image)
+        face_locations = self._locate_faces(rgb_image)
         face_encodings = face_recognition.face_encodings(rgb_image, face_locations)
         
         results = []
-        for (top, right, bottom, left), face_encoding in zip(face_locations, face_encodings):
-            # Compare with known faces
-            matches = face_recognition.compare_faces(self.known_face_encodings, face_encoding)
-            face_distances = face_recognition.face_distance(self.known_face_encodings, face_encoding)
-            
+        if not face_encodings:
+            return results
+
+        # One vectorized distance computation for all detected faces against
+        # all known faces, instead of two dlib calls per face
+        encodings = np.asarray(face_encodings, dtype=np.float32)
+        distances = np.linalg.norm(self._known_matrix[None, :, :] - encodings[:, None, :], axis=2)
+        best_indices = distances.argmin(axis=1)
+
+        for i, ((top, right, bottom, left), face_encoding) in enumerate(zip(face_locations, face_encodings)):
             name = "Unknown"
             confidence = 0.5
-            
-            if matches:
-                best_match_index = np.argmin(face_distances)
-                if matches[best_match_index]:
-                    name = self.known_face_names[best_match_index]
-                    confidence = 1.0 - face_distances[best_match_index]
-            
+
+            best_distance = distances[i, best_indices[i]]
+            if best_distance < 0.6:
+                name = self.known_face_names[best_indices[i]]
+                confidence = 1.0 - best_distance
+
             results.append(DetectionResult(
                 mode=DetectionMode.FACE_RECOGNITION,
                 confidence=confidence,
@@ -316,61 +713,125 @@ class OCRSystem:
         """Initialize the OCR system"""
         # Configure Tesseract
         self.tesseract_config = '--oem 3 --psm 6'
+
+        # Lazily-created CUDA filters for the GPU preprocessing path
+        self._cuda_filters = None
+        self._cuda_checked = False
+
+    def _get_cuda_filters(self) -> Optional[Dict[str, Any]]:
+        """Create the reusable CUDA preprocessing filters on first use
+
+        Returns:
+            Dict of filter objects, or None when no CUDA device is available
+        """
+        if not self._cuda_checked:
+            self._cuda_checked = True
+            try:
+                if cv2.cuda.getCudaEnabledDeviceCount() > 0:
+                    self._cuda_filters = {
+                        'gauss': cv2.cuda.createGaussianFilter(cv2.CV_8UC1, cv2.CV_8UC1, (5, 5), 0),
+                        'local_mean': cv2.cuda.createGaussianFilter(cv2.CV_8UC1, cv2.CV_8UC1, (11, 11), 0),
+                        'close': cv2.cuda.createMorphologyFilter(
+                            cv2.MORPH_CLOSE, cv2.CV_8UC1, np.ones((2, 2), np.uint8)),
+                    }
+            except (cv2.error, AttributeError):
+                self._cuda_filters = None
+        return self._cuda_filters
+
+    def _preprocess_for_ocr_cuda(self, image: np.ndarray, filters: Dict[str, Any]) -> np.ndarray:
+        """GPU version of the OCR preprocessing chain
+
+        The image stays in VRAM between stages; only the final binarized
+        result is downloaded for Tesseract.
+
+        Args:
+            image: Input BGR image
+            filters: Reusable CUDA filters from _get_cuda_filters
+
+        Returns:
+            Preprocessed image on the host
+        """
+        gpu = cv2.cuda_GpuMat()
+        gpu.upload(image)
+
+        gray = cv2.cuda.cvtColor(gpu, cv2.COLOR_BGR2GRAY)
+        blurred = filters['gauss'].apply(gray)
+
+        # Adaptive Gaussian threshold, expressed as GPU primitives:
+        # keep pixels brighter than their 11x11 local mean minus C=2
+        local_mean = filters['local_mean'].apply(blurred)
+        offset = cv2.cuda.subtract(local_mean, (2, 2, 2, 2))
+        mask = cv2.cuda.compare(blurred, offset, cv2.CMP_GT)
+
+        cleaned = filters['close'].apply(mask)
+        return cleaned.download()
     
-    def extract_text(self, image: np.ndarray, preprocess: bool = True) -> List[DetectionResult]:
+    def extract_text(self, image: np.ndarray, preprocess: bool = True,
+                     views: FrameViews = None) -> List[DetectionResult]:
         """Extract text from an image
-        
+
         Args:
             image: Input image
             preprocess: Whether to preprocess the image
-            
+            views: Precomputed color-space views of the image (optional)
+
         Returns:
             List of text detection results
         """
         processed_image = image.copy()
-        
+
         if preprocess:
-            processed_image = self.preprocess_for_ocr(processed_image)
+            processed_image = self.preprocess_for_ocr(processed_image, views=views)
         
         try:
             # Extract text with bounding boxes
             data = pytesseract.image_to_data(processed_image, config=self.tesseract_config, output_type=pytesseract.Output.DICT)
             
+            # Filter low confidence and empty text with one vectorized mask,
+            # so the Python loop only touches the surviving boxes
+            confidences = np.asarray(data['conf'], dtype=np.float32)
+            texts = np.char.strip(np.asarray(data['text'], dtype=str))
+            mask = (confidences > 30) & (np.char.str_len(texts) > 0)
+
             results = []
-            n_boxes = len(data['level'])
-            
-            for i in range(n_boxes):
-                confidence = float(data['conf'][i])
-                text = data['text'][i].strip()
-                
-                if confidence > 30 and text:  # Filter low confidence and empty text
-                    x, y, w, h = data['left'][i], data['top'][i], data['width'][i], data['height'][i]
-                    
-                    results.append(DetectionResult(
-                        mode=DetectionMode.OCR,
-                        confidence=confidence / 100.0,
-                        bbox=(x, y, w, h),
-                        label=text,
-                        metadata={"word_num": data['word_num'][i], "block_num": data['block_num'][i]}
-                    ))
-            
+            for i in np.where(mask)[0]:
+                x, y, w, h = data['left'][i], data['top'][i], data['width'][i], data['height'][i]
+
+                results.append(DetectionResult(
+                    mode=DetectionMode.OCR,
+                    confidence=float(confidences[i]) / 100.0,
+                    bbox=(x, y, w, h),
+                    label=str(texts[i]),
+                    metadata={"word_num": data['word_num'][i], "block_num": data['block_num'][i]}
+                ))
+
             return results
             
         except Exception as e:
             logger.error(f"OCR extraction failed: {e}")
             return []
     
-    def preprocess_for_ocr(self, image: np.ndarray) -> np.ndarray:
+    def preprocess_for_ocr(self, image: np.ndarray, views: FrameViews = None) -> np.ndarray:
         """Preprocess image for better OCR results
-        
+
         Args:
             image: Input image
-            
+            views: Precomputed color-space views of the image (optional)
+
         Returns:
             Preprocessed image
         """
-        # Convert to grayscale
-        gray = cv2.cvtColor(image, cv2.COLOR_BGR2GRAY)
+        # Run the whole chain on the GPU when one is available
+        filters = self._get_cuda_filters()
+        if filters is not None:
+            try:
+                return self._preprocess_for_ocr_cuda(image, filters)
+            except cv2.error as e:
+                logger.warning(f"CUDA OCR preprocessing failed, using CPU: {e}")
+                self._cuda_filters = None
+
+        # Convert to grayscale (reuses the shared view when provided)
+        gray = (views or FrameViews(image)).gray
         
         # Apply Gaussian blur
         blurred = cv2.GaussianBlur(gray, (5, 5), 0)
@@ -390,7 +851,99 @@ class ImageSegmentation:
     def __init__(self):
         """Initialize the segmentation system"""
         self.model = None
+        # Fitted MiniBatchKMeans models keyed by cluster count, reused
+        # across video frames
+        self._kmeans_cache = {}
+
+        # Reusable GrabCut buffers; the mask doubles as the warm-start
+        # state on consecutive frames
+        self._gc_mask = None
+        self._gc_bgd = np.zeros((1, 65), np.float64)
+        self._gc_fgd = np.zeros((1, 65), np.float64)
+
+        # Lazily-created CUDA filters for the watershed preprocessing
+        self._ws_filters = None
+        self._ws_cuda_checked = False
+
         self.load_segmentation_model()
+
+    def _get_watershed_cuda(self) -> Optional[Dict[str, Any]]:
+        """Create the reusable watershed CUDA filters on first use
+
+        Returns:
+            Dict of filter objects, or None when no CUDA device is available
+        """
+        if not self._ws_cuda_checked:
+            self._ws_cuda_checked = True
+            try:
+                if cv2.cuda.getCudaEnabledDeviceCount() > 0:
+                    kernel = np.ones((3, 3), np.uint8)
+                    self._ws_filters = {
+                        'open': cv2.cuda.createMorphologyFilter(
+                            cv2.MORPH_OPEN, cv2.CV_8UC1, kernel, iterations=2),
+                        'dilate': cv2.cuda.createMorphologyFilter(
+                            cv2.MORPH_DILATE, cv2.CV_8UC1, kernel, iterations=3),
+                    }
+            except (cv2.error, AttributeError):
+                self._ws_filters = None
+        return self._ws_filters
+
+    @staticmethod
+    def _otsu_from_hist(hist: np.ndarray) -> float:
+        """Compute the Otsu threshold level from a 256-bin histogram
+
+        Args:
+            hist: Grayscale histogram
+
+        Returns:
+            Threshold level maximizing between-class variance
+        """
+        hist = hist.ravel().astype(np.float64)
+        total = hist.sum()
+        if total == 0:
+            return 0.0
+
+        bins = np.arange(256)
+        w0 = np.cumsum(hist)
+        w1 = total - w0
+        m0 = np.cumsum(hist * bins)
+        mean_total = m0[-1]
+
+        with np.errstate(divide='ignore', invalid='ignore'):
+            mu0 = m0 / w0
+            mu1 = (mean_total - m0) / w1
+            var_between = w0 * w1 * (mu0 - mu1) ** 2
+        var_between[np.isnan(var_between)] = 0
+
+        return float(np.argmax(var_between))
+
+    def _watershed_masks_cuda(self, image: np.ndarray, filters: Dict[str, Any]):
+        """Compute the opening and sure-background masks on the GPU
+
+        cvtColor, the Otsu threshold (level derived from a downloaded
+        256-bin histogram) and both morphology stages stay in VRAM; only
+        the two final masks are downloaded, since distanceTransform and
+        watershed itself have no CUDA counterparts.
+
+        Args:
+            image: Input BGR image
+            filters: Reusable CUDA filters from _get_watershed_cuda
+
+        Returns:
+            Tuple of (opening, sure_bg) masks on the host
+        """
+        gpu = cv2.cuda_GpuMat()
+        gpu.upload(image)
+        gray = cv2.cuda.cvtColor(gpu, cv2.COLOR_BGR2GRAY)
+
+        hist = cv2.cuda.calcHist(gray).download()
+        level = self._otsu_from_hist(hist)
+        _, thresh = cv2.cuda.threshold(gray, level, 255, cv2.THRESH_BINARY_INV)
+
+        opening = filters['open'].apply(thresh)
+        sure_bg = filters['dilate'].apply(opening)
+
+        return opening.download(), sure_bg.download()
     
     def load_segmentation_model(self):
         """Load pre-trained segmentation model"""
@@ -421,19 +974,35 @@ class ImageSegmentation:
             return self.watershed_segmentation(image)
     
     def watershed_segmentation(self, image: np.ndarray) -> np.ndarray:
-        """Watershed segmentation algorithm"""
-        gray = cv2.cvtColor(image, cv2.COLOR_BGR2GRAY)
-        
-        # Apply threshold
-        _, thresh = cv2.threshold(gray, 0, 255, cv2.THRESH_BINARY_INV + cv2.THRESH_OTSU)
-        
-        # Noise removal
-        kernel = np.ones((3, 3), np.uint8)
-        opening = cv2.morphologyEx(thresh, cv2.MORPH_OPEN, kernel, iterations=2)
-        
-        # Sure background area
-        sure_bg = cv2.dilate(opening, kernel, iterations=3)
-        
+        """Watershed segmentation algorithm
+
+        The grayscale conversion, Otsu threshold and morphology passes run
+        on the GPU when one is available, so the full-resolution image only
+        crosses the bus twice instead of once per stage.
+        """
+        opening = sure_bg = None
+
+        filters = self._get_watershed_cuda()
+        if filters is not None:
+            try:
+                opening, sure_bg = self._watershed_masks_cuda(image, filters)
+            except cv2.error as e:
+                logger.warning(f"CUDA watershed preprocessing failed, using CPU: {e}")
+                self._ws_filters = None
+
+        if opening is None:
+            gray = cv2.cvtColor(image, cv2.COLOR_BGR2GRAY)
+
+            # Apply threshold
+            _, thresh = cv2.threshold(gray, 0, 255, cv2.THRESH_BINARY_INV + cv2.THRESH_OTSU)
+
+            # Noise removal
+            kernel = np.ones((3, 3), np.uint8)
+            opening = cv2.morphologyEx(thresh, cv2.MORPH_OPEN, kernel, iterations=2)
+
+            # Sure background area
+            sure_bg = cv2.dilate(opening, kernel, iterations=3)
+
         # Finding sure foreground area
         dist_transform = cv2.distanceTransform(opening, cv2.DIST_L2, 5)
         _, sure_fg = cv2.threshold(dist_transform, 0.7 * dist_transform.max(), 255, 0)
@@ -454,42 +1023,57 @@ class ImageSegmentation:
         return image
     
     def kmeans_segmentation(self, image: np.ndarray, k: int = 3) -> np.ndarray:
-        """K-means clustering segmentation"""
-        data = image.reshape((-1, 3))
-        data = np.float32(data)
-        
-        # Apply K-means
-        criteria = (cv2.TERM_CRITERIA_EPS + cv2.TERM_CRITERIA_MAX_ITER, 10, 1.0)
-        _, labels, centers = cv2.kmeans(data, k, None, criteria, 10, cv2.KMEANS_RANDOM_CENTERS)
-        
+        """K-means clustering segmentation
+
+        Centroids are fitted with MiniBatchKMeans on a 5% pixel subsample
+        (20x fewer distance computations than full k-means over all
+        pixels), then the full image is labelled in one vectorized
+        predict. The fitted model is cached per k for repeated frames.
+        """
+        data = image.reshape((-1, 3)).astype(np.float32)
+
+        kmeans = self._kmeans_cache.get(k)
+        if kmeans is None:
+            sample_size = max(k, data.shape[0] // 20)
+            sample_idx = np.random.choice(data.shape[0], size=sample_size, replace=False)
+            kmeans = MiniBatchKMeans(n_clusters=k, batch_size=4096, n_init=3).fit(data[sample_idx])
+            self._kmeans_cache[k] = kmeans
+
+        labels = kmeans.predict(data)
+
         # Convert back to uint8 and reshape
-        centers = np.uint8(centers)
-        segmented_data = centers[labels.flatten()]
-        segmented_image = segmented_data.reshape(image.shape)
-        
+        centers = kmeans.cluster_centers_.astype(np.uint8)
+        segmented_image = centers[labels].reshape(image.shape)
+
         return segmented_image
     
     def grabcut_segmentation(self, image: np.ndarray) -> np.ndarray:
-        """GrabCut segmentation algorithm"""
+        """GrabCut segmentation algorithm
+
+        The mask and GMM model buffers live on the instance, so repeated
+        calls (video frames) skip the per-call allocations and warm-start
+        from the previous frame's mask, where GrabCut converges in ~2
+        iterations instead of 5 from scratch.
+        """
         height, width = image.shape[:2]
-        
-        # Initialize mask
-        mask = np.zeros((height, width), np.uint8)
-        
-        # Define rectangle for probable foreground
-        rect = (50, 50, width - 100, height - 100)
-        
-        # Initialize background and foreground models
-        bgd_model = np.zeros((1, 65), np.float64)
-        fgd_model = np.zeros((1, 65), np.float64)
-        
-        # Apply GrabCut
-        cv2.grabCut(image, mask, rect, bgd_model, fgd_model, 5, cv2.GC_INIT_WITH_RECT)
-        
+
+        if self._gc_mask is None or self._gc_mask.shape != (height, width):
+            # Cold start: rectangle init over the probable foreground
+            self._gc_mask = np.zeros((height, width), np.uint8)
+            self._gc_bgd[...] = 0
+            self._gc_fgd[...] = 0
+            rect = (50, 50, width - 100, height - 100)
+            cv2.grabCut(image, self._gc_mask, rect, self._gc_bgd, self._gc_fgd,
+                        5, cv2.GC_INIT_WITH_RECT)
+        else:
+            # Warm start from the previous frame's mask and models
+            cv2.grabCut(image, self._gc_mask, None, self._gc_bgd, self._gc_fgd,
+                        2, cv2.GC_INIT_WITH_MASK)
+
         # Modify mask
-        mask2 = np.where((mask == 2) | (mask == 0), 0, 1).astype('uint8')
+        mask2 = np.where((self._gc_mask == 2) | (self._gc_mask == 0), 0, 1).astype('uint8')
         result = image * mask2[:, :, np.newaxis]
-        
+
         return result
 
 class PoseEstimation:
@@ -498,46 +1082,77 @@ class PoseEstimation:
     def __init__(self):
         """Initialize pose estimation"""
         self.mp_pose = mp.solutions.pose
-        self.pose = self.mp_pose.Pose(
-            static_image_mode=False,
-            model_complexity=1,
-            enable_segmentation=False,
-            min_detection_confidence=0.5
-        )
         self.mp_drawing = mp.solutions.drawing_utils
-    
-    def estimate_pose(self, image: np.ndarray) -> List[DetectionResult]:
+
+        # Lazily-created per-mode MediaPipe instances: the video variant
+        # keeps the cross-frame tracker and uses the ~3x faster Lite model,
+        # the image variant redetects from scratch so stale tracker state
+        # from unrelated stills can't leak between calls
+        self._pose_video = None
+        self._pose_image = None
+
+        # Preallocated (x, y, z, visibility) buffer for the 33 pose landmarks,
+        # refilled each frame instead of building a list of dicts
+        self._lm_buf = np.empty((33, 4), np.float32)
+
+    def _get_pose(self, is_video: bool):
+        """Get the MediaPipe Pose instance for the given input kind
+
+        Args:
+            is_video: True for video streams, False for single images
+
+        Returns:
+            Configured mp.solutions.pose.Pose instance
+        """
+        if is_video:
+            if self._pose_video is None:
+                self._pose_video = self.mp_pose.Pose(
+                    static_image_mode=False,
+                    model_complexity=0,
+                    enable_segmentation=False,
+                    min_detection_confidence=0.5
+                )
+            return self._pose_video
+
+        if self._pose_image is None:
+            self._pose_image = self.mp_pose.Pose(
+                static_image_mode=True,
+                model_complexity=1,
+                enable_segmentation=False,
+                min_detection_confidence=0.5
+            )
+        return self._pose_image
+
+    def estimate_pose(self, image: np.ndarray, views: FrameViews = None,
+                      is_video: bool = True) -> List[DetectionResult]:
         """Estimate human pose in image
-        
+
         Args:
             image: Input image
-            
+            views: Precomputed color-space views of the image (optional)
+            is_video: Whether the image is part of a video stream
+
         Returns:
             List of pose detection results
         """
-        rgb_image = cv2.cvtColor(image, cv2.COLOR_BGR2RGB)
-        results = self.pose.process(rgb_image)
+        rgb_image = (views or FrameViews(image)).rgb
+        results = self._get_pose(is_video).process(rgb_image)
         
         detection_results = []
         
         if results.pose_landmarks:
-            # Extract key points
-            landmarks = []
-            for landmark in results.pose_landmarks.landmark:
-                landmarks.append({
-                    'x': landmark.x,
-                    'y': landmark.y,
-                    'z': landmark.z,
-                    'visibility': landmark.visibility
-                })
-            
-            # Calculate bounding box
-            x_coords = [lm['x'] for lm in landmarks]
-            y_coords = [lm['y'] for lm in landmarks]
-            
-            x_min, x_max = min(x_coords), max(x_coords)
-            y_min, y_max = min(y_coords), max(y_coords)
-            
+            # Extract key points into the preallocated buffer
+            for i, landmark in enumerate(results.pose_landmarks.landmark):
+                self._lm_buf[i, 0] = landmark.x
+                self._lm_buf[i, 1] = landmark.y
+                self._lm_buf[i, 2] = landmark.z
+                self._lm_buf[i, 3] = landmark.visibility
+            landmarks = self._lm_buf.copy()
+
+            # Calculate bounding box in one pass (JIT-compiled when numba
+            # is installed)
+            x_min, y_min, x_max, y_max = _landmark_bbox(np.ascontiguousarray(landmarks[:, :2]))
+
             height, width = image.shape[:2]
             bbox = (
                 int(x_min * width),
@@ -556,19 +1171,127 @@ class PoseEstimation:
         
         return detection_results
 
+class DetectionStore:
+    """Columnar ring buffer for detection results
+
+    Replaces the unbounded per-frame list of nested dicts/dataclasses:
+    bounding boxes, confidences and label ids live in preallocated NumPy
+    arrays (structure-of-arrays) with labels interned in a shared table.
+    Memory stays bounded at `capacity` detections and export writes the
+    columns directly instead of walking a Python object graph.
+    """
+
+    def __init__(self, capacity: int = 100000):
+        """Preallocate the columns
+
+        Args:
+            capacity: Maximum number of detections retained
+        """
+        self.capacity = capacity
+        self.bboxes = np.zeros((capacity, 4), np.int32)
+        self.confidences = np.zeros(capacity, np.float32)
+        self.label_ids = np.zeros(capacity, np.int16)
+        self.frame_ids = np.zeros(capacity, np.int32)
+        self.labels = []
+        self._label_id_map = {}
+        self.write_head = 0
+        self.count = 0
+
+    def _intern(self, label: str) -> int:
+        """Map a label string to its stable integer id"""
+        label_id = self._label_id_map.get(label)
+        if label_id is None:
+            label_id = len(self.labels)
+            self.labels.append(label)
+            self._label_id_map[label] = label_id
+        return label_id
+
+    def push_many(self, frame_id: int, detections: List[DetectionResult]):
+        """Append a frame's detections to the ring buffer
+
+        Args:
+            frame_id: Frame (or image) index the detections belong to
+            detections: Detection results to record
+        """
+        for detection in detections:
+            i = self.write_head
+            self.bboxes[i] = detection.bbox
+            self.confidences[i] = detection.confidence
+            self.label_ids[i] = self._intern(detection.label)
+            self.frame_ids[i] = frame_id
+            self.write_head = (i + 1) % self.capacity
+            self.count = min(self.count + 1, self.capacity)
+
+    def save(self, output_path: str):
+        """Write the stored detections as compressed columnar arrays
+
+        Args:
+            output_path: Destination .npz path
+        """
+        if self.count < self.capacity:
+            rows = np.arange(self.count)
+        else:
+            # Buffer has wrapped; restore chronological order
+            rows = (np.arange(self.capacity) + self.write_head) % self.capacity
+
+        np.savez_compressed(
+            output_path,
+            bboxes=self.bboxes[rows],
+            confidences=self.confidences[rows],
+            label_ids=self.label_ids[rows],
+            frame_ids=self.frame_ids[rows],
+            labels=np.asarray(self.labels)
+        )
+
 class ComputerVisionSystem:
     """Main computer vision system that integrates all components"""
-    
-    def __init__(self):
-        """Initialize the computer vision system"""
+
+    # MediaPipe pose skeleton edges (torso, arms, legs) used for drawing
+    _POSE_EDGES = np.array([
+        [11, 12], [11, 13], [13, 15], [12, 14], [14, 16],
+        [11, 23], [12, 24], [23, 24], [23, 25], [25, 27],
+        [24, 26], [26, 28], [27, 29], [29, 31], [28, 30], [30, 32],
+    ], np.int32)
+
+    def __init__(self, detect_every: int = 5):
+        """Initialize the computer vision system
+
+        Args:
+            detect_every: Run the heavy detectors every N video frames;
+                boxes are propagated by lightweight trackers in between
+        """
         self.object_detector = ObjectDetector()
         self.face_recognition = FaceRecognitionSystem()
         self.ocr_system = OCRSystem()
         self.segmentation = ImageSegmentation()
         self.pose_estimation = PoseEstimation()
-        
-        # Results storage
-        self.results_history = []
+
+        # Skip-frame detector scheduling state
+        self.detect_every = detect_every
+        self._frame_idx = 0
+        self._trackers = []
+
+        # Results storage (bounded, columnar)
+        self.detection_store = DetectionStore()
+
+        # Single worker for OCR: pytesseract spends its time waiting on the
+        # Tesseract subprocess, so a thread is enough to overlap it with
+        # the other detectors on the same frame
+        self._ocr_pool = ThreadPoolExecutor(max_workers=1)
+
+    @staticmethod
+    def _create_tracker():
+        """Create a lightweight KCF tracker, handling OpenCV API variants
+
+        Returns:
+            Tracker instance, or None when opencv-contrib is unavailable
+        """
+        if hasattr(cv2, 'TrackerKCF_create'):
+            return cv2.TrackerKCF_create()
+        try:
+            return cv2.legacy.TrackerKCF_create()
+        except AttributeError:
+            return None
     
     def process_image(self, image_path: str, modes: List[DetectionMode]) -> Dict[str, List[DetectionResult]]:
         """Process an image with specified detection modes
@@ -586,74 +1309,170 @@ class ComputerVisionSystem:
             raise ValueError(f"Could not load image: {image_path}")
         
         results = {}
-        
+
+        # Shared color conversions, computed at most once for all modes
+        views = FrameViews(image)
+
         for mode in modes:
             if mode == DetectionMode.OBJECT_DETECTION:
-                results['objects'] = self.object_detector.detect_objects(image)
-            
+                results['objects'] = self.object_detector.detect_objects(image, views=views)
+
             elif mode == DetectionMode.FACE_DETECTION:
-                results['faces'] = self.face_recognition.detect_faces(image)
-            
+                results['faces'] = self.face_recognition.detect_faces(image, views=views)
+
             elif mode == DetectionMode.FACE_RECOGNITION:
-                results['face_recognition'] = self.face_recognition.recognize_faces(image)
-            
+                results['face_recognition'] = self.face_recognition.recognize_faces(image, views=views)
+
             elif mode == DetectionMode.OCR:
-                results['text'] = self.ocr_system.extract_text(image)
-            
+                results['text'] = self.ocr_system.extract_text(image, views=views)
+
             elif mode == DetectionMode.POSE_ESTIMATION:
-                results['poses'] = self.pose_estimation.estimate_pose(image)
-        
-        # Store results
-        self.results_history.append({
-            'image_path': image_path,
-            'timestamp': time.time(),
-            'results': results
-        })
+                results['poses'] = self.pose_estimation.estimate_pose(image, views=views, is_video=False)
         
+        # Store results in the columnar buffer
+        for detections in results.values():
+            self.detection_store.push_many(self._frame_idx, detections)
+        self._frame_idx += 1
+
         return results
     
-    def process_video(self, video_path: str, modes: List[DetectionMode], output_path: str = None):
+    def process_video(self, video_path: str, modes: List[DetectionMode], output_path: str = None,
+                      prefetch: int = 8):
         """Process a video file with real-time detection
-        
+
+        Decode, detection and encode run as a 3-stage pipeline: a reader
+        thread decodes frame N+1 while the main thread runs detection on
+        frame N and a writer thread encodes frame N-1. The compute stage
+        stays single-threaded so the stateful detector models need no
+        locking.
+
         Args:
             video_path: Path to the video file
             modes: List of detection modes to apply
             output_path: Path to save processed video
+            prefetch: Bounded queue depth between pipeline stages
         """
-        cap = cv2.VideoCapture(video_path)
-        
+        # Prefer NVDEC hardware decode when OpenCV was built with cudacodec;
+        # frames are downloaded once for the CPU-bound detectors
+        cap = None
+        gpu_reader = None
+        try:
+            if hasattr(cv2, 'cudacodec') and cv2.cuda.getCudaEnabledDeviceCount() > 0:
+                gpu_reader = cv2.cudacodec.createVideoReader(video_path)
+                logger.info("Decoding video with NVDEC")
+        except (cv2.error, AttributeError):
+            gpu_reader = None
+
+        out = None
+        gpu_writer = None
         if output_path:
+            if gpu_reader is not None:
+                # Match the writer to the stream format for NVENC encode
+                try:
+                    fmt = gpu_reader.format()
+                    gpu_writer = cv2.cudacodec.createVideoWriter(
+                        output_path, (fmt.width, fmt.height), cv2.cudacodec.H264, fmt.fps)
+                    logger.info("Encoding video with NVENC")
+                except (cv2.error, AttributeError):
+                    gpu_writer = None
+                    gpu_reader = None
+
+        if gpu_reader is None:
+            cap = cv2.VideoCapture(video_path)
+
+        if output_path and gpu_writer is None:
             fourcc = cv2.VideoWriter_fourcc(*'XVID')
             fps = int(cap.get(cv2.CAP_PROP_FPS))
             width = int(cap.get(cv2.CAP_PROP_FRAME_WIDTH))
             height = int(cap.get(cv2.CAP_PROP_FRAME_HEIGHT))
             out = cv2.VideoWriter(output_path, fourcc, fps, (width, height))
-        
+
+        read_q = queue.Queue(maxsize=prefetch)
+        write_q = queue.Queue(maxsize=prefetch)
+        stop_event = threading.Event()
+
+        def reader():
+            """Decode frames ahead of the compute stage (None = EOF)"""
+            while not stop_event.is_set():
+                if gpu_reader is not None:
+                    ret, gpu_frame = gpu_reader.nextFrame()
+                    frame = gpu_frame.download() if ret and gpu_frame is not None else None
+                    ret = ret and frame is not None
+                else:
+                    ret, frame = cap.read()
+                if not ret:
+                    break
+                while not stop_event.is_set():
+                    try:
+                        read_q.put(frame, timeout=0.1)
+                        break
+                    except queue.Full:
+                        continue
+            # The EOF sentinel must not be dropped: without it the main
+            # loop blocks forever on read_q.get(), so retry like a frame
+            while not stop_event.is_set():
+                try:
+                    read_q.put(None, timeout=0.1)
+                    break
+                except queue.Full:
+                    continue
+
+        def writer():
+            """Encode processed frames behind the compute stage"""
+            gpu_buf = cv2.cuda_GpuMat() if gpu_writer is not None else None
+            while True:
+                frame = write_q.get()
+                if frame is None:
+                    break
+                if gpu_writer is not None:
+                    gpu_buf.upload(frame)
+                    gpu_writer.write(gpu_buf)
+                else:
+                    out.write(frame)
+
+        reader_thread = threading.Thread(target=reader, daemon=True)
+        reader_thread.start()
+
+        writer_thread = None
+        if output_path:
+            writer_thread = threading.Thread(target=writer, daemon=True)
+            writer_thread.start()
+
         frame_count = 0
-        
+
         while True:
-            ret, frame = cap.read()
-            if not ret:
+            frame = read_q.get()
+            if frame is None:
                 break
-            
+
             # Process frame
             processed_frame = self.process_frame(frame, modes)
-            
-            # Display or save frame
+
+            # Display or hand off to the writer thread
             if output_path:
-                out.write(processed_frame)
+                write_q.put(processed_frame)
             else:
                 cv2.imshow('Computer Vision System', processed_frame)
                 if cv2.waitKey(1) & 0xFF == ord('q'):
                     break
-            
+
             frame_count += 1
             if frame_count % 30 == 0:
                 logger.info(f"Processed {frame_count} frames")
-        
-        cap.release()
-        if output_path:
+
+        # Shut the pipeline down (also handles early quit via 'q')
+        stop_event.set()
+        reader_thread.join()
+        if writer_thread:
+            write_q.put(None)
+            writer_thread.join()
+
+        if cap is not None:
+            cap.release()
+        if out is not None:
             out.release()
+        if gpu_writer is not None:
+            gpu_writer.release()
         cv2.destroyAllWindows()
     
     def process_frame(self, frame: np.ndarray, modes: List[DetectionMode]) -> np.ndarray:
@@ -667,28 +1486,72 @@ class ComputerVisionSystem:
             Processed frame with annotations
         """
         annotated_frame = frame.copy()
-        
+
+        # Shared color conversions, computed at most once for all modes
+        views = FrameViews(frame)
+
+        # Kick OCR off first so the Tesseract subprocess runs concurrently
+        # with the detectors below; joined just before drawing
+        ocr_future = None
+        if DetectionMode.OCR in modes:
+            ocr_future = self._ocr_pool.submit(self.ocr_system.extract_text, frame.copy())
+
+        # The heavy detectors (objects, faces) only run every
+        # detect_every-th frame; on intermediate frames their boxes are
+        # propagated by cheap KCF trackers instead
+        detector_colors = {
+            DetectionMode.OBJECT_DETECTION: (0, 255, 0),
+            DetectionMode.FACE_DETECTION: (255, 0, 0),
+            DetectionMode.FACE_RECOGNITION: (0, 0, 255),
+        }
+        heavy_modes = [mode for mode in modes if mode in detector_colors]
+        run_detectors = (self._frame_idx % self.detect_every == 0) or not self._trackers
+
+        if heavy_modes and run_detectors:
+            self._trackers = []
+            for mode in heavy_modes:
+                if mode == DetectionMode.OBJECT_DETECTION:
+                    detections = self.object_detector.detect_objects(frame, views=views)
+                elif mode == DetectionMode.FACE_DETECTION:
+                    detections = self.face_recognition.detect_faces(frame, views=views)
+                else:
+                    detections = self.face_recognition.recognize_faces(frame, views=views)
+
+                annotated_frame = self.draw_detections(annotated_frame, detections, detector_colors[mode])
+
+                for detection in detections:
+                    tracker = self._create_tracker()
+                    if tracker is not None:
+                        tracker.init(frame, detection.bbox)
+                        self._trackers.append((tracker, detection))
+        elif heavy_modes:
+            surviving = []
+            for tracker, detection in self._trackers:
+                ok, bbox = tracker.update(frame)
+                if not ok:
+                    continue
+                moved = DetectionResult(
+                    mode=detection.mode,
+                    confidence=detection.confidence,
+                    bbox=tuple(int(v) for v in bbox),
+                    label=detection.label,
+                    metadata=detection.metadata
+                )
+                surviving.append((tracker, moved))
+                annotated_frame = self.draw_detections(annotated_frame, [moved],
+                                                       detector_colors[moved.mode])
+            self._trackers = surviving
+
         for mode in modes:
-            if mode == DetectionMode.OBJECT_DETECTION:
-                objects = self.object_detector.detect_objects(frame)
-                annotated_frame = self.draw_detections(annotated_frame, objects, (0, 255, 0))
-            
-            elif mode == DetectionMode.FACE_DETECTION:
-                faces = self.face_recognition.detect_faces(frame)
-                annotated_frame = self.draw_detections(annotated_frame, faces, (255, 0, 0))
-            
-            elif mode == DetectionMode.FACE_RECOGNITION:
-                face_recognition = self.face_recognition.recognize_faces(frame)
-                annotated_frame = self.draw_detections(annotated_frame, face_recognition, (0, 0, 255))
-            
-            elif mode == DetectionMode.OCR:
-                text_results = self.ocr_system.extract_text(frame)
+            if mode == DetectionMode.OCR:
+                text_results = ocr_future.result()
                 annotated_frame = self.draw_detections(annotated_frame, text_results, (255, 255, 0))
-            
+
             elif mode == DetectionMode.POSE_ESTIMATION:
-                poses = self.pose_estimation.estimate_pose(frame)
+                poses = self.pose_estimation.estimate_pose(frame, views=views)
                 annotated_frame = self.draw_pose(annotated_frame, poses)
-        
+
+        self._frame_idx += 1
         return annotated_frame
     
     def draw_detections(self, image: np.ndarray, detections: List[DetectionResult], color: Tuple[int, int, int]) -> np.ndarray:
@@ -725,25 +1588,27 @@ class ComputerVisionSystem:
             Image with drawn poses
         """
         for pose in poses:
-            landmarks = pose.metadata.get('landmarks', [])
+            landmarks = pose.metadata.get('landmarks')
+            if landmarks is None:
+                continue
             height, width = image.shape[:2]
-            
-            # Draw landmarks
-            for landmark in landmarks:
-                x = int(landmark['x'] * width)
-                y = int(landmark['y'] * height)
-                cv2.circle(image, (x, y), 3, (0, 255, 255), -1)
-        
+
+            # Scale all landmarks to pixel coordinates in one vectorized
+            # step, then draw the skeleton as a single polylines batch
+            # instead of 33 per-point cv2.circle calls
+            pts = (landmarks[:, :2] * np.array([width, height], np.float32)).astype(np.int32)
+            cv2.polylines(image, [pts[edge] for edge in self._POSE_EDGES],
+                          False, (0, 255, 255), 1)
+
         return image
     
     def save_results(self, output_path: str):
-        """Save detection results to file
-        
+        """Save detection results to a compressed .npz file
+
         Args:
             output_path: Path to save results
         """
-        with open(output_path, 'w') as f:
-            json.dump(self.results_history, f, indent=2, default=str)
+        self.detection_store.save(output_path)
 
 class CVApplication:
     """Main application class for the computer vision system"""
@@ -0,0 +1,83 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+
+"""
+YOLO INT8 Quantization Script
+-----------------------------
+Produces yolo/yolov4_int8.onnx from a YOLO ONNX export using static
+quantization over a set of representative frames. The INT8 model is
+picked up automatically by the ObjectDetector in
+27_advanced_computer_vision.py on CPU-only machines.
+
+Usage:
+    python quantize_yolo_int8.py --model yolo/yolov4.onnx \
+        --calibration-dir calibration_frames --output yolo/yolov4_int8.onnx
+"""
+
+import argparse
+import os
+
+import cv2
+import numpy as np
+from onnxruntime.quantization import CalibrationDataReader, quantize_static, QuantType
+
+
+class FrameCalibrationReader(CalibrationDataReader):
+    """Feeds preprocessed frames to the static quantizer"""
+
+    def __init__(self, calibration_dir: str, input_name: str, max_frames: int = 200):
+        """Collect calibration images from a directory
+
+        Args:
+            calibration_dir: Directory of representative frames (jpg/png)
+            input_name: Name of the model's input tensor
+            max_frames: Cap on the number of calibration frames
+        """
+        self.input_name = input_name
+        self.image_paths = sorted(
+            os.path.join(calibration_dir, name)
+            for name in os.listdir(calibration_dir)
+            if name.lower().endswith(('.jpg', '.jpeg', '.png'))
+        )[:max_frames]
+        self._iterator = iter(self.image_paths)
+
+    def get_next(self):
+        path = next(self._iterator, None)
+        if path is None:
+            return None
+
+        image = cv2.imread(path)
+        if image is None:
+            return self.get_next()
+
+        # Same preprocessing as ObjectDetector.detect_objects
+        blob = cv2.dnn.blobFromImage(image, 0.00392, (416, 416), (0, 0, 0), True, crop=False)
+        return {self.input_name: blob.astype(np.float32)}
+
+
+def main():
+    """Main entry point"""
+    parser = argparse.ArgumentParser(description='Quantize a YOLO ONNX model to INT8')
+    parser.add_argument('--model', type=str, default='yolo/yolov4.onnx',
+                        help='Path to the FP32 ONNX model')
+    parser.add_argument('--calibration-dir', type=str, required=True,
+                        help='Directory with ~200 representative frames')
+    parser.add_argument('--output', type=str, default='yolo/yolov4_int8.onnx',
+                        help='Path for the quantized model')
+    parser.add_argument('--max-frames', type=int, default=200,
+                        help='Maximum number of calibration frames')
+    args = parser.parse_args()
+
+    import onnxruntime
+    session = onnxruntime.InferenceSession(args.model, providers=['CPUExecutionProvider'])
+    input_name = session.get_inputs()[0].name
+
+    reader = FrameCalibrationReader(args.calibration_dir, input_name, args.max_frames)
+    quantize_static(args.model, args.output, reader,
+                    activation_type=QuantType.QUInt8, weight_type=QuantType.QInt8)
+
+    print(f"Quantized model saved to: {args.output}")
+
+
+if __name__ == "__main__":
+    main()
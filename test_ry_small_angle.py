@@ -0,0 +1,69 @@
+#!/usr/bin/env python3
+"""
+Test the small-angle RY fast path against the exact rotation
+"""
+
+import sys
+import os
+sys.path.append(os.path.dirname(os.path.abspath(__file__)))
+
+import numpy as np
+
+# Import the quantum ML module from the main file
+import importlib.util
+spec = importlib.util.spec_from_file_location("quantum_part4", "26_quantum_computing_simulator_part4.py")
+quantum_part4 = importlib.util.module_from_spec(spec)
+spec.loader.exec_module(quantum_part4)
+
+
+def _exact_ry(state, theta, qubit, num_qubits):
+    """Apply an exact RY rotation with the simulator's bit convention
+
+    The simulator maps qubit 0 to the most significant bit of the state
+    index, so the full operator is I x ... x RY x ... x I with RY at
+    position `qubit` from the left.
+    """
+    ry = np.array([
+        [np.cos(theta), -np.sin(theta)],
+        [np.sin(theta), np.cos(theta)]
+    ], dtype=state.dtype)
+
+    full = np.array([[1.0]], dtype=state.dtype)
+    for position in range(num_qubits):
+        full = np.kron(full, ry if position == qubit else np.eye(2, dtype=state.dtype))
+
+    return full @ state
+
+
+def test_fast_path_matches_exact():
+    """Fast path must agree with the exact rotation on every qubit"""
+    num_qubits = 3
+    theta = 0.01  # Well below SMALL_ANGLE_THRESHOLD
+
+    for qubit in range(num_qubits):
+        simulator = quantum_part4.QuantumSimulator(num_qubits)
+
+        # Put the register in a non-trivial superposition so a rotation
+        # on the wrong qubit cannot go unnoticed
+        rng = np.random.default_rng(42)
+        state = rng.random(2 ** num_qubits) + 1j * rng.random(2 ** num_qubits)
+        state /= np.linalg.norm(state)
+        simulator.state_vector = state.astype(simulator.state_vector.dtype)
+
+        expected = _exact_ry(simulator.state_vector.copy(), theta, qubit, num_qubits)
+
+        quantum_part4.QuantumML._apply_ry_small_angle(simulator, theta, qubit)
+        simulator.state_vector /= np.linalg.norm(simulator.state_vector)
+
+        # First-order update: error should be O(theta^2), not O(theta)
+        max_diff = np.max(np.abs(simulator.state_vector - expected))
+        status = "PASS" if max_diff < 10 * theta ** 2 else "FAIL"
+        print(f"qubit {qubit}: max diff {max_diff:.2e} ({status})")
+        assert max_diff < 10 * theta ** 2, \
+            f"fast path diverged from exact RY on qubit {qubit}: {max_diff}"
+
+
+if __name__ == "__main__":
+    print("Testing small-angle RY fast path...")
+    test_fast_path_matches_exact()
+    print("\nAll tests passed!")